@@ -1,29 +1,32 @@
-import re
+try:
+    import re2 as re
+except ImportError:
+    import re
 from collections import Counter
 
+REQUEST_RE = re.compile(rb'(?m)^.*?"(\w+) ([^ \n]+) HTTP/\d\.\d" (\d+)')
+
 status_codes = Counter()
 endpoints = Counter()
 methods = Counter()
 
-pattern = r'"(\w+) ([^ ]+) HTTP/\d\.\d" (\d+)'
+with open('/logs/access.log', 'rb') as f:
+    requests = REQUEST_RE.findall(f.read())
 
-with open('/logs/access.log') as f:
-    for line in f:
-        match = re.search(pattern, line)
-        if match:
-            method, path, status = match.groups()
-            methods[method] += 1
-            endpoints[path] += 1
-            status_codes[status] += 1
+if requests:
+    request_methods, paths, statuses = zip(*requests)
+    methods.update(request_methods)
+    endpoints.update(paths)
+    status_codes.update(statuses)
 
 print('HTTP Methods:')
 for method, count in methods.most_common():
-    print(f'  {method}: {count}')
+    print(f'  {method.decode()}: {count}')
 
 print()
 print('Status Codes:')
 for status, count in sorted(status_codes.items()):
-    print(f'  {status}: {count}')
+    print(f'  {status.decode()}: {count}')
 
 print()
-print(f'Most accessed: {endpoints.most_common(1)[0][0]}')
+print(f'Most accessed: {endpoints.most_common(1)[0][0].decode()}')
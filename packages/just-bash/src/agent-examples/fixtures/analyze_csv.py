@@ -3,11 +3,17 @@ from collections import defaultdict
 
 revenue = defaultdict(float)
 with open('/data/sales.csv') as f:
-    reader = csv.DictReader(f)
-    for row in reader:
-        product = row['product']
-        total = int(row['quantity']) * float(row['price'])
-        revenue[product] += total
+    reader = csv.reader(f)
+    header = next(reader, None)
+    if header is not None:
+        columns = {name: i for i, name in enumerate(header)}
+        product_col = columns['product']
+        quantity_col = columns['quantity']
+        price_col = columns['price']
+        for row in reader:
+            if not row:
+                continue
+            revenue[row[product_col]] += int(row[quantity_col]) * float(row[price_col])
 
 for product in sorted(revenue.keys()):
     print(f'{product}: ${revenue[product]:.2f}')
@@ -1,18 +1,47 @@
-import json
+try:
+    import ijson
+except ImportError:
+    ijson = None
 
-with open('/api/response.json') as f:
-    data = json.load(f)
+try:
+    from orjson import loads
+except ImportError:
+    from json import loads
 
-users = data['data']['users']
-pagination = data['data']['pagination']
+def collect_metadata(events, meta):
+    for prefix, event, value in events:
+        if prefix == 'status':
+            meta['status'] = value
+        elif prefix.startswith('data.pagination.'):
+            meta['pagination'][prefix[len('data.pagination.'):]] = value
+        yield prefix, event, value
 
-total_posts = sum(len(u['posts']) for u in users)
-users_with_posts = sum(1 for u in users if u['posts'])
-avg_posts = total_posts / len(users) if users else 0
+user_count = 0
+users_with_posts = 0
+total_posts = 0
+
+with open('/api/response.json', 'rb') as f:
+    if ijson is None:
+        data = loads(f.read())
+        meta = {'status': data['status'], 'pagination': data['data']['pagination']}
+        users = data['data']['users']
+    else:
+        meta = {'pagination': {}}
+        users = ijson.items(collect_metadata(ijson.parse(f), meta), 'data.users.item')
+
+    for u in users:
+        user_count += 1
+        if u['posts']:
+            users_with_posts += 1
+            total_posts += len(u['posts'])
+
+status = meta['status']
+pagination = meta['pagination']
+avg_posts = total_posts / user_count if user_count else 0
 
 print('API Response Statistics:')
-print(f'  Status: {data["status"]}')
-print(f'  Users in response: {len(users)}')
+print(f'  Status: {status}')
+print(f'  Users in response: {user_count}')
 print(f'  Users with posts: {users_with_posts}')
 print(f'  Total posts: {total_posts}')
 print(f'  Average posts per user: {avg_posts:.1f}')
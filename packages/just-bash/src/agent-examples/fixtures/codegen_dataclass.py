@@ -1,24 +1,25 @@
-import json
+import sys
 
-TYPE_MAP = {
-    'int': 'int',
-    'str': 'str',
-    'float': 'float',
-    'bool': 'bool',
-    'datetime': 'datetime'
-}
+try:
+    from orjson import loads
+except ImportError:
+    from json import loads
 
-with open('/project/schema.json') as f:
-    schema = json.load(f)
+def python_type(field_type):
+    match field_type:
+        case 'int' | 'str' | 'float' | 'bool' | 'datetime':
+            return field_type
+        case _:
+            return 'Any'
 
-print('from dataclasses import dataclass')
-print('from datetime import datetime')
-print()
+with open('/project/schema.json', 'rb') as f:
+    schema = loads(f.read())
 
+parts = ['from dataclasses import dataclass\nfrom datetime import datetime\n\n']
 for class_name, config in schema.items():
-    print('@dataclass')
-    print(f'class {class_name}:')
+    parts.append(f'@dataclass\nclass {class_name}:\n')
     for field_name, field_type in config['fields'].items():
-        py_type = TYPE_MAP.get(field_type, 'Any')
-        print(f'    {field_name}: {py_type}')
-    print()
+        parts.append(f"    {field_name}: {python_type(field_type)}\n")
+    parts.append('\n')
+
+sys.stdout.write(''.join(parts))
@@ -1,24 +1,38 @@
-import json
+import sys
 
-SQL_TYPE_MAP = {
-    'int': 'INTEGER',
-    'str': 'VARCHAR(255)',
-    'float': 'DECIMAL(10,2)',
-    'bool': 'BOOLEAN',
-    'datetime': 'TIMESTAMP'
-}
+try:
+    from orjson import loads
+except ImportError:
+    from json import loads
 
-with open('/project/schema.json') as f:
-    schema = json.load(f)
+def sql_type(field_type):
+    match field_type:
+        case 'int':
+            return 'INTEGER'
+        case 'str':
+            return 'VARCHAR(255)'
+        case 'float':
+            return 'DECIMAL(10,2)'
+        case 'bool':
+            return 'BOOLEAN'
+        case 'datetime':
+            return 'TIMESTAMP'
+        case _:
+            return 'TEXT'
 
+with open('/project/schema.json', 'rb') as f:
+    schema = loads(f.read())
+
+parts = []
 for table_name, config in schema.items():
     table_lower = table_name.lower() + 's'
-    print(f'CREATE TABLE {table_lower} (')
-    fields = list(config['fields'].items())
-    for i, (field_name, field_type) in enumerate(fields):
-        sql_type = SQL_TYPE_MAP.get(field_type, 'TEXT')
-        pk = ' PRIMARY KEY' if field_name == 'id' else ''
-        comma = ',' if i < len(fields) - 1 else ''
-        print(f'    {field_name} {sql_type}{pk}{comma}')
-    print(');')
-    print()
+    columns = [
+        f"    {name} {sql_type(field_type)}{' PRIMARY KEY' if name == 'id' else ''}"
+        for name, field_type in config['fields'].items()
+    ]
+    parts.append(f'CREATE TABLE {table_lower} (\n')
+    if columns:
+        parts.append(',\n'.join(columns) + '\n')
+    parts.append(');\n\n')
+
+sys.stdout.write(''.join(parts))
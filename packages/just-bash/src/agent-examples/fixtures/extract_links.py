@@ -1,13 +1,14 @@
 import re
 
+LINK_RE = re.compile(rb'\[([^\]]+)\]\(([^)]+)\)')
+
 links = []
 
-with open('/docs/README.md') as f:
+with open('/docs/README.md', 'rb') as f:
     content = f.read()
 
-link_pattern = r'\[([^\]]+)\]\(([^)]+)\)'
-for match in re.finditer(link_pattern, content):
-    links.append({'text': match.group(1), 'url': match.group(2)})
+for match in LINK_RE.finditer(content):
+    links.append({'text': match.group(1).decode(), 'url': match.group(2).decode()})
 
 print(f'Found {len(links)} links:')
 for link in links:
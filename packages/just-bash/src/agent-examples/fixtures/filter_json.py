@@ -1,7 +1,10 @@
-import json
+try:
+    from orjson import loads
+except ImportError:
+    from json import loads
 
-with open('/data/users.json') as f:
-    users = json.load(f)
+with open('/data/users.json', 'rb') as f:
+    users = loads(f.read())
 
 admins = [u for u in users if u['role'] == 'admin']
 print(f'Total users: {len(users)}')
@@ -1,27 +1,36 @@
-import json
+import sys
 
-with open('/api/response.json') as f:
-    data = json.load(f)
+try:
+    import ijson
+except ImportError:
+    ijson = None
 
-rows = []
-for user in data['data']['users']:
-    if user['posts']:
-        for post in user['posts']:
-            rows.append({
-                'user_id': user['id'],
-                'user_name': user['name'],
-                'post_id': post['id'],
-                'post_title': post['title']
-            })
+try:
+    from orjson import loads
+except ImportError:
+    from json import loads
+
+sys.stdout.reconfigure(line_buffering=False)
+write = sys.stdout.write
+
+with open('/api/response.json', 'rb') as f:
+    if ijson is None:
+        users = loads(f.read())['data']['users']
+        count = sum(len(user['posts']) or 1 for user in users)
     else:
-        rows.append({
-            'user_id': user['id'],
-            'user_name': user['name'],
-            'post_id': None,
-            'post_title': None
-        })
+        count = sum(len(posts) or 1 for posts in ijson.items(f, 'data.users.item.posts'))
+        f.seek(0)
+        users = ijson.items(f, 'data.users.item')
 
-print(f'Flattened {len(rows)} records:')
-for row in rows:
-    post_info = f"Post #{row['post_id']}: {row['post_title']}" if row['post_id'] else 'No posts'
-    print(f"  User {row['user_name']}: {post_info}")
+    print(f'Flattened {count} records:')
+    for user in users:
+        name = user['name']
+        posts = user['posts']
+        if not posts:
+            write(f'  User {name}: No posts\n')
+            continue
+        for post in posts:
+            if post['id']:
+                write(f"  User {name}: Post #{post['id']}: {post['title']}\n")
+            else:
+                write(f'  User {name}: No posts\n')
@@ -1,19 +1,27 @@
 import json
 
+try:
+    from orjson import loads
+except ImportError:
+    from json import loads
+
 def deep_merge(base, override):
-    result = base.copy()
-    for key, value in override.items():
-        if key in result and isinstance(result[key], dict) and isinstance(value, dict):
-            result[key] = deep_merge(result[key], value)
-        else:
-            result[key] = value
-    return result
+    stack = [(base, override)]
+    while stack:
+        target, source = stack.pop()
+        for key, value in source.items():
+            current = target.get(key)
+            if isinstance(current, dict) and isinstance(value, dict):
+                stack.append((current, value))
+            else:
+                target[key] = value
+    return base
 
-with open('/config/base.json') as f:
-    base = json.load(f)
+with open('/config/base.json', 'rb') as f:
+    base = loads(f.read())
 
-with open('/config/production.json') as f:
-    prod = json.load(f)
+with open('/config/production.json', 'rb') as f:
+    prod = loads(f.read())
 
 merged = deep_merge(base, prod)
 
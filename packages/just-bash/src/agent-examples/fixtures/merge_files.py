@@ -1,20 +1,25 @@
 import os
 import json
 
-records = []
 input_dir = '/input'
 
-for filename in sorted(os.listdir(input_dir)):
-    if filename.endswith('.txt'):
-        filepath = os.path.join(input_dir, filename)
-        record = {}
-        with open(filepath) as f:
-            for line in f:
-                if ':' in line:
-                    key, value = line.strip().split(': ', 1)
-                    if key == 'age':
-                        value = int(value)
-                    record[key] = value
-        records.append(record)
+def parse_record(filepath):
+    record = {}
+    with open(filepath) as f:
+        for line in f:
+            key, sep, value = line.partition(': ')
+            if sep:
+                key = key.lstrip()
+                value = value.rstrip()
+                if key == 'age':
+                    value = int(value)
+                record[key] = value
+    return record
+
+paths = sorted(
+    entry.path for entry in os.scandir(input_dir)
+    if entry.name.endswith('.txt') and entry.is_file()
+)
+records = list(map(parse_record, paths))
 
 print(json.dumps(records, indent=2))
@@ -1,17 +1,19 @@
 import re
+from collections import Counter
+
+ENTRY_RE = re.compile(rb'^(?:## \[(.+?)\] - .+|### (Added|Changed|Fixed))', re.M)
 
 versions = []
+sections = Counter()
 
-with open('/docs/CHANGELOG.md') as f:
+with open('/docs/CHANGELOG.md', 'rb') as f:
     content = f.read()
 
-ver_pattern = r'## \[(.+?)\] - (.+)'
-for match in re.finditer(ver_pattern, content):
-    versions.append(match.group(1))
-
-added = len(re.findall(r'^### Added', content, re.M))
-changed = len(re.findall(r'^### Changed', content, re.M))
-fixed = len(re.findall(r'^### Fixed', content, re.M))
+for version, section in ENTRY_RE.findall(content):
+    if section:
+        sections[section] += 1
+    else:
+        versions.append(version.decode())
 
 print(f'Found {len(versions)} versions:')
 for ver in versions:
@@ -19,6 +21,6 @@ for ver in versions:
 
 print()
 print('Change types across all versions:')
-print(f'  Added sections: {added}')
-print(f'  Changed sections: {changed}')
-print(f'  Fixed sections: {fixed}')
+print(f'  Added sections: {sections[b"Added"]}')
+print(f'  Changed sections: {sections[b"Changed"]}')
+print(f'  Fixed sections: {sections[b"Fixed"]}')
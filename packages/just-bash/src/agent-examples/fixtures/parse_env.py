@@ -1,5 +1,7 @@
 import re
 
+KEY_RE = re.compile(r'^[A-Z][A-Z0-9_]*$')
+
 env_vars = {}
 issues = []
 
@@ -15,23 +17,23 @@ with open('/config/.env.example') as f:
 
         key, value = line.split('=', 1)
 
-        if not re.match(r'^[A-Z][A-Z0-9_]*$', key):
+        if not KEY_RE.match(key):
             issues.append(f'Line {line_num}: Invalid key format: {key}')
 
         env_vars[key] = value
 
-print('Environment variables:')
+out = ['Environment variables:']
 for key, value in env_vars.items():
     display = '***' if 'KEY' in key or 'SECRET' in key or 'PASSWORD' in key else value
-    print(f'  {key}={display}')
+    out.append(f'  {key}={display}')
 
-print()
-print(f'Total: {len(env_vars)} variables')
+out.append('')
+out.append(f'Total: {len(env_vars)} variables')
+out.append('')
 if issues:
-    print()
-    print('Issues found:')
-    for issue in issues:
-        print(f'  - {issue}')
+    out.append('Issues found:')
+    out.extend(f'  - {issue}' for issue in issues)
 else:
-    print()
-    print('No issues found')
+    out.append('No issues found')
+
+print('\n'.join(out))
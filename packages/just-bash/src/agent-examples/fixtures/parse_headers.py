@@ -1,12 +1,19 @@
-import re
+try:
+    import re2 as re
+except ImportError:
+    import re
 from collections import Counter
 
+HEADER_RE = re.compile(r'^(#+)\s+(.+)')
+
 headers = Counter()
 toc = []
 
 with open('/docs/README.md') as f:
     for line in f:
-        match = re.match(r'^(#+)\s+(.+)$', line)
+        if not line.startswith('#'):
+            continue
+        match = HEADER_RE.match(line)
         if match:
             level = len(match.group(1))
             title = match.group(2)
@@ -14,11 +21,8 @@ with open('/docs/README.md') as f:
             indent = '  ' * (level - 1)
             toc.append(f'{indent}- {title}')
 
-print('Table of Contents:')
-for item in toc:
-    print(item)
-
-print()
-print('Header counts:')
+out = ['Table of Contents:', *toc, '', 'Header counts:']
 for level, count in sorted(headers.items()):
-    print(f'  {level}: {count}')
+    out.append(f'  {level}: {count}')
+
+print('\n'.join(out))
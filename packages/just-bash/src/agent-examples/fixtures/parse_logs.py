@@ -1,23 +1,35 @@
-import re
-from collections import Counter
+try:
+    import re2 as re
+except ImportError:
+    import re
 
-levels = Counter()
+LOG_LINE_RE = re.compile(rb'(?m)^\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2} (\w+).*')
+
+info = debug = warn = error = 0
 errors = []
 
-with open('/logs/app.log') as f:
-    for line in f:
-        match = re.match(r'\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2} (\w+)', line)
-        if match:
-            level = match.group(1)
-            levels[level] += 1
-            if level == 'ERROR':
-                parts = line.strip().split(' ', 3)
-                if len(parts) >= 4:
-                    errors.append(parts[3])
+with open('/logs/app.log', 'rb') as f:
+    content = f.read()
+
+for match in LOG_LINE_RE.finditer(content):
+    level = match.group(1)
+    if level == b'INFO':
+        info += 1
+    elif level == b'DEBUG':
+        debug += 1
+    elif level == b'WARN':
+        warn += 1
+    elif level == b'ERROR':
+        error += 1
+        parts = match.group(0).strip().split(b' ', 3)
+        if len(parts) >= 4:
+            errors.append(parts[3].decode())
 
 print('Log level counts:')
-for level in ['INFO', 'DEBUG', 'WARN', 'ERROR']:
-    print(f'  {level}: {levels[level]}')
+print(f'  INFO: {info}')
+print(f'  DEBUG: {debug}')
+print(f'  WARN: {warn}')
+print(f'  ERROR: {error}')
 print()
 print(f'Errors found: {len(errors)}')
 for err in errors:
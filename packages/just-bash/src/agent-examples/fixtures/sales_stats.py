@@ -6,13 +6,20 @@ total_quantity = 0
 total_revenue = 0
 
 with open('/data/sales.csv') as f:
-    reader = csv.DictReader(f)
-    for row in reader:
-        qty = int(row['quantity'])
-        price = float(row['price'])
-        products[row['product']] += qty
-        total_quantity += qty
-        total_revenue += qty * price
+    reader = csv.reader(f)
+    header = next(reader, None)
+    if header is not None:
+        columns = {name: i for i, name in enumerate(header)}
+        product_col = columns['product']
+        quantity_col = columns['quantity']
+        price_col = columns['price']
+        for row in reader:
+            if not row:
+                continue
+            qty = int(row[quantity_col])
+            products[row[product_col]] += qty
+            total_quantity += qty
+            total_revenue += qty * float(row[price_col])
 
 print(f'Total items sold: {total_quantity}')
 print(f'Total revenue: ${total_revenue:.2f}')
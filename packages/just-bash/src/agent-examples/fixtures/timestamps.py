@@ -1,19 +1,19 @@
-import re
+try:
+    import re2 as re
+except ImportError:
+    import re
 from datetime import datetime
 
-timestamps = []
-pattern = r'(\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2})'
+TIMESTAMP_RE = re.compile(rb'(?m)^(\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2})')
 
-with open('/logs/app.log') as f:
-    for line in f:
-        match = re.match(pattern, line)
-        if match:
-            ts = datetime.strptime(match.group(1), '%Y-%m-%d %H:%M:%S')
-            timestamps.append(ts)
+with open('/logs/app.log', 'rb') as f:
+    stamps = TIMESTAMP_RE.findall(f.read())
 
-if timestamps:
-    duration = timestamps[-1] - timestamps[0]
-    print(f'First entry: {timestamps[0].strftime("%H:%M:%S")}')
-    print(f'Last entry: {timestamps[-1].strftime("%H:%M:%S")}')
+if stamps:
+    first = datetime.fromisoformat(stamps[0].decode())
+    last = datetime.fromisoformat(stamps[-1].decode())
+    duration = last - first
+    print(f'First entry: {first.strftime("%H:%M:%S")}')
+    print(f'Last entry: {last.strftime("%H:%M:%S")}')
     print(f'Time span: {int(duration.total_seconds() // 60)} minutes')
-    print(f'Total entries: {len(timestamps)}')
+    print(f'Total entries: {len(stamps)}')
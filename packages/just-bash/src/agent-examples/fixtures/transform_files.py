@@ -1,20 +1,25 @@
 import os
 
 input_dir = '/input'
-results = []
 
-for filename in sorted(os.listdir(input_dir)):
-    if filename.endswith('.txt'):
-        filepath = os.path.join(input_dir, filename)
-        data = {}
-        with open(filepath) as f:
-            for line in f:
-                if ':' in line:
-                    key, value = line.strip().split(': ', 1)
-                    data[key] = value
+def parse_record(filepath):
+    data = {}
+    with open(filepath) as f:
+        for line in f:
+            key, sep, value = line.partition(': ')
+            if sep:
+                data[key.lstrip()] = value.rstrip()
+    return data
+
+paths = sorted(
+    entry.path for entry in os.scandir(input_dir)
+    if entry.name.endswith('.txt') and entry.is_file()
+)
 
-        if int(data.get('age', 0)) > 28:
-            results.append(f"{data['name']} ({data['age']}) - {data['occupation']} in {data['city']}")
+results = []
+for data in map(parse_record, paths):
+    if int(data.get('age', 0)) > 28:
+        results.append(f"{data['name']} ({data['age']}) - {data['occupation']} in {data['city']}")
 
 print('People over 28:')
 for r in results:
@@ -1,24 +1,33 @@
 import csv
 import re
-from datetime import datetime
+from datetime import date
+
+EMAIL_RE = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+DATE_RE = re.compile(r'(\d{4})-(1[0-2]|0[1-9]|[1-9])-(3[01]|[12]\d|0[1-9]|[1-9]| [1-9])')
+NON_DIGIT_BYTES = bytes(c for c in range(256) if c not in b'0123456789')
 
 def validate_email(email):
     if not email:
         return False, 'Empty email'
-    pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-    if not re.match(pattern, email):
+    _, at, domain = email.rpartition('@')
+    if not at or '.' not in domain:
+        return False, 'Invalid format'
+    if not EMAIL_RE.match(email):
         return False, 'Invalid format'
     return True, None
 
 def validate_phone(phone):
-    digits = re.sub(r'[^0-9]', '', phone)
+    digits = phone.encode('ascii', 'ignore').translate(None, NON_DIGIT_BYTES)
     if len(digits) < 7 or len(digits) > 15:
         return False, 'Invalid length'
     return True, None
 
 def validate_date(date_str):
+    match = DATE_RE.fullmatch(date_str)
+    if not match:
+        return False, 'Invalid format'
     try:
-        datetime.strptime(date_str, '%Y-%m-%d')
+        date(*map(int, match.groups()))
         return True, None
     except ValueError:
         return False, 'Invalid format'
@@ -27,31 +36,43 @@ errors = []
 valid_count = 0
 
 with open('/data/users.csv') as f:
-    reader = csv.DictReader(f)
-    for row in reader:
-        row_errors = []
-
-        valid, err = validate_email(row['email'])
-        if not valid:
-            row_errors.append(f'email: {err}')
-
-        valid, err = validate_phone(row['phone'])
-        if not valid:
-            row_errors.append(f'phone: {err}')
-
-        valid, err = validate_date(row['created_at'])
-        if not valid:
-            row_errors.append(f'date: {err}')
-
-        if row_errors:
-            errors.append(f"Row {row['id']}: {', '.join(row_errors)}")
-        else:
-            valid_count += 1
-
-print('Validation Results:')
-print(f'  Valid rows: {valid_count}')
-print(f'  Invalid rows: {len(errors)}')
-print()
-print('Errors:')
-for err in errors:
-    print(f'  {err}')
+    reader = csv.reader(f)
+    header = next(reader, None)
+    if header is not None:
+        columns = {name: i for i, name in enumerate(header)}
+        id_col = columns['id']
+        email_col = columns['email']
+        phone_col = columns['phone']
+        date_col = columns['created_at']
+        for row in reader:
+            if not row:
+                continue
+            row_errors = []
+
+            valid, err = validate_email(row[email_col])
+            if not valid:
+                row_errors.append(f'email: {err}')
+
+            valid, err = validate_phone(row[phone_col])
+            if not valid:
+                row_errors.append(f'phone: {err}')
+
+            valid, err = validate_date(row[date_col])
+            if not valid:
+                row_errors.append(f'date: {err}')
+
+            if row_errors:
+                errors.append(f"Row {row[id_col]}: {', '.join(row_errors)}")
+            else:
+                valid_count += 1
+
+out = [
+    'Validation Results:',
+    f'  Valid rows: {valid_count}',
+    f'  Invalid rows: {len(errors)}',
+    '',
+    'Errors:',
+]
+out.extend(f'  {err}' for err in errors)
+
+print('\n'.join(out))